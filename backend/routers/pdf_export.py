@@ -238,7 +238,8 @@ async def export_concentration_sheets(
                 item_dir = FATINA_BASE_DIR / folder
                 if item_dir.is_dir():
                     for f in sorted(item_dir.iterdir(), key=lambda p: p.name.lower()):
-                        if f.is_file():
+                        # Skip temp files left behind by an interrupted export
+                        if f.is_file() and not f.name.startswith(".") and f.suffix != ".tmp":
                             arcname = Path("Fatina") / folder / f.name
                             zipf.write(f, str(arcname).replace("\\", "/"))
                 else:
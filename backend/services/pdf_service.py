@@ -1,6 +1,6 @@
 from reportlab.lib.pagesizes import A3, letter, A4, landscape
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
@@ -8,15 +8,60 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from pathlib import Path
 import logging
+import os
 import re
+import tempfile
+import threading
+import time
+from bisect import bisect_left
 from xml.sax.saxutils import escape
-from datetime import datetime
+from io import BytesIO
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import itemgetter
 from models import models
 from bidi.algorithm import get_display
 import arabic_reshaper
 from fatina_paths import FATINA_BASE_DIR, sanitize_folder_name, calculation_file_uri
 
 
+def _write_pdf_file(filepath, pdf_buffer) -> None:
+    """Write a PDF built in memory to filepath via a temp file and an atomic rename."""
+    filepath = Path(filepath)
+    # A unique temp name, so concurrent exports to the same file never share it
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        # One write straight from the buffer's memory, without copying it to bytes
+        with os.fdopen(fd, "wb") as pdf_file, pdf_buffer.getbuffer() as pdf_bytes:
+            pdf_file.write(pdf_bytes)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Last stamp handed out by _export_timestamp and how many times it was used
+_EXPORT_TIMESTAMP_LOCK = threading.Lock()
+_last_export_timestamp = {"stamp": "", "count": 0}
+
+
+def _export_timestamp() -> str:
+    """Local-time stamp used in export file names, e.g. 20240131_142501.
+
+    Exports started within the same second get a counter suffix
+    (20240131_142501_2, ...) so they do not overwrite each other's files.
+    """
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    with _EXPORT_TIMESTAMP_LOCK:
+        if stamp != _last_export_timestamp["stamp"]:
+            _last_export_timestamp["stamp"] = stamp
+            _last_export_timestamp["count"] = 1
+            return stamp
+        _last_export_timestamp["count"] += 1
+        return f"{stamp}_{_last_export_timestamp['count']}"
+
+
 def _get_calculation_sheet_file_name(db_session, calculation_sheet_no):
     """Resolve calculation_sheet_no to CalculationSheet.file_name, or None."""
     if not db_session or not calculation_sheet_no:
@@ -46,17 +91,348 @@ BOQ_PDF_FONT_SIZE = 7
 BOQ_PDF_HEADER_FONT_SIZE = 8
 BOQ_PDF_CELL_PADDING = 12
 BOQ_PDF_HORIZONTAL_MARGIN = 108  # matches leftMargin + rightMargin on the BOQ PDF
+# BOQ items PDF column order; updated_contract_quantity_* columns follow the
+# leading columns, then price, then updated_contract_sum_*, then the trailing ones.
+BOQ_PDF_LEADING_COLUMNS = (
+    'serial_number', 'structure', 'system', 'section_number', 'description', 'unit',
+    'original_contract_quantity',
+)
+BOQ_PDF_TRAILING_COLUMNS = (
+    'total_contract_sum', 'estimated_quantity', 'quantity_submitted', 'internal_quantity',
+    'approved_by_project_manager', 'approved_signed_quantity',
+    'partially_submitted_quantity', 'total_estimate',
+    'total_submitted', 'internal_total', 'total_approved_by_project_manager',
+    'approved_signed_total', 'partial_submitted_total',
+    'total_decrease', 'total_increase', 'subsection', 'notes',
+)
+# Columns summed into the GRAND TOTAL row (plus every updated_contract_sum_*).
+BOQ_PDF_TOTAL_COLUMNS = frozenset({
+    'total_contract_sum',
+    'total_estimate',
+    'total_submitted',
+    'internal_total',
+    'total_approved_by_project_manager',
+    'approved_signed_total',
+    'partial_submitted_total',
+    'total_decrease',
+    'total_increase',
+})
+BOQ_PDF_CANVAS_MIN_ROWS = 1000  # from this many items the table is drawn directly on the canvas
+
+# Hebrew, Arabic and other RTL characters
+_RTL_CHARS_RE = re.compile(r'[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB1D-\uFDFF\uFE70-\uFEFF]')
+# Hebrew block only
+_HEBREW_CHARS_RE = re.compile(r'[\u0590-\u05FF]')
+
+# Summary columns whose numeric values are rendered as shekel amounts.
+SUMMARY_CURRENCY_KEYWORDS = ("total", "estimate", "submitted", "approved")
+
+
+def _is_summary_currency_key(key: str) -> bool:
+    """True when a structures/systems/subsections summary column holds money."""
+    key_lower = key.lower()
+    return any(keyword in key_lower for keyword in SUMMARY_CURRENCY_KEYWORDS)
+
+
+_SUMMARY_HEADER_TRANSLATIONS = {
+    "en": {
+        'structure': 'Structure',
+        'system': 'System',
+        'subsection': 'Subsection',
+        'description': 'Description',
+        'total_contract_sum': 'Total Contract Sum',
+        'total_estimate': 'Total Estimate',
+        'total_submitted': 'Total Submitted',
+        'internal_total': 'Internal Total',
+        'total_approved': 'Total Approved',
+        'approved_signed_total': 'Approved Signed Total',
+        'partial_submitted_total': 'Total Partially Submitted',
+        'item_count': 'Item Count',
+    },
+    "he": {
+        'structure': 'מבנה',
+        'system': 'מערכת',
+        'subsection': 'תת-פרק',
+        'description': 'תיאור',
+        'total_contract_sum': 'סה"כ חוזה',
+        'total_estimate': 'סה"כ מחושב',
+        'total_submitted': 'סה״כ מוגש',
+        'internal_total': 'סה"כ פנימי',
+        'total_approved': 'סה"כ מאושר',
+        'approved_signed_total': 'סה"כ מאושר חתום',
+        'partial_submitted_total': 'סה"כ מוגש חלקי',
+        'item_count': 'מספר פריטים',
+    },
+}
+
+
+# ReportLab's sample stylesheet, built once; exports only read styles from it.
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+# Shared by the summary and concentration sheet exports; styles are read-only
+# once built, so one instance serves every export.
+_SUMMARY_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_SAMPLE_STYLES['Heading1'],
+    fontSize=16,
+    spaceAfter=30,
+    alignment=1  # Center alignment
+)
+
+
+# Per-sheet totals table of export_concentration_sheets.
+_CONCENTRATION_SHEET_TOTALS_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_NON_BOQ_TITLE_STYLE = ParagraphStyle(
+    "NonBoqTitle",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=16,
+    spaceAfter=12,
+    alignment=1,
+)
+_NON_BOQ_SUBTITLE_STYLE = ParagraphStyle(
+    "NonBoqSubtitle",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=10,
+    spaceAfter=20,
+    alignment=1,
+)
+_NON_BOQ_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#366092")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F5F5F5")]),
+    ("TOPPADDING", (0, 0), (-1, -1), 6),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+])
+
+# Plain-table fallback of export_summary, appended after its ALIGN command.
+_BOQ_SUMMARY_FALLBACK_STYLE_COMMANDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # Bright gray for header row
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),  # Black text for better contrast
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -2), colors.white),  # White background for data rows
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+)
+
+# Fallback summary table styling, applied after the language-specific ALIGN command.
+_SUMMARY_FALLBACK_STYLE_COMMANDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -2), colors.white),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+)
+
+
+@lru_cache(maxsize=16)
+def _robust_table_style(align_mode, font_size, cell_padding):
+    """TableStyle for _create_robust_hebrew_table; Table.setStyle only reads it, so it is shared."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # Brighter blue for headers
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # White text for better contrast
+        ('ALIGN', (0, 0), (-1, -1), align_mode),  # Alignment based on language
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), cell_padding),
+        ('TOPPADDING', (0, 0), (-1, -1), cell_padding),
+        ('BACKGROUND', (0, 1), (-1, -2), colors.white),
+        ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP')  # Top alignment for multi-line content
+    ])
+
+
+# (grand total label, report title) for each summary kind and language.
+_SUMMARY_CTX = {
+    ("structures", "en"): ("GRAND TOTAL", "Structures Summary Report"),
+    ("structures", "he"): ("סה\"כ כללי", "דוח סיכום מבנים"),
+    ("systems", "en"): ("GRAND TOTAL", "Systems Summary Report"),
+    ("systems", "he"): ("סה\"כ כללי", "דוח סיכום מערכות"),
+    ("subsections", "en"): ("GRAND TOTAL", "Subsections Summary Report"),
+    ("subsections", "he"): ("סה\"כ כללי", "דוח סיכום תת-פרקים"),
+}
+
+
+def _summary_context(kind, language):
+    """(grand_total_text, title_text) for a summary export; any non-Hebrew language uses English."""
+    return _SUMMARY_CTX[(kind, "he" if language == "he" else "en")]
+
+
+@lru_cache(maxsize=32)
+def _translate_summary_headers(language, raw_headers):
+    """Translated column headers for a structures/systems/subsections summary."""
+    translations = _SUMMARY_HEADER_TRANSLATIONS["he" if language == "he" else "en"]
+    return tuple(translations.get(header, header) for header in raw_headers)
+
+
+@lru_cache(maxsize=None)
+def _type1_char_widths(font_name):
+    """Map each character of a standard (Type 1) font's encoding to its glyph width.
+
+    Returns None for TrueType fonts (see _ttf_char_widths).
+    """
+    font = pdfmetrics.getFont(font_name)
+    if isinstance(font, TTFont) or not hasattr(font, "encName"):
+        return None
+    encoding = font.encName
+    char_widths = {}
+    for code in range(256):
+        try:
+            char = bytes((code,)).decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        if len(char) == 1 and char.encode(encoding) == bytes((code,)):
+            char_widths[char] = font.widths[code]
+    return char_widths
+
+
+@lru_cache(maxsize=None)
+def _ttf_char_widths(font_name):
+    """Map each character of a TrueType font to its glyph width.
+
+    Returns (char_widths, default_width), or None for non-TrueType fonts.
+    ReportLab keys these metrics by code point, which costs an ord() call per
+    character when measuring.
+    """
+    font = pdfmetrics.getFont(font_name)
+    if not isinstance(font, TTFont):
+        return None
+    face = font.face
+    char_widths = {chr(code): width for code, width in face.charWidths.items()}
+    return char_widths, face.defaultWidth
+
+
+@lru_cache(maxsize=16384)
+def _cached_string_width(text, font_name, font_size):
+    """pdfmetrics.stringWidth memoized by (text, font, size).
+
+    Column sizing measures every cell, and BOQ/summary columns repeat the
+    same quantities, prices and labels across many rows. Both font kinds sum
+    a per-character width table directly (the same arithmetic as ReportLab);
+    Type 1 text outside the font's encoding falls back to stringWidth.
+    """
+    char_widths = _type1_char_widths(font_name)
+    if char_widths is not None:
+        try:
+            return sum(map(char_widths.__getitem__, text)) * 0.001 * font_size
+        except KeyError:
+            pass
+    else:
+        ttf_widths = _ttf_char_widths(font_name)
+        if ttf_widths is not None:
+            char_widths, default_width = ttf_widths
+            return 0.001 * font_size * sum(map(char_widths.get, text, repeat(default_width)))
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
+# Standard landscape page sizes in points, narrowest first
+_LANDSCAPE_PAGE_SIZES = (
+    ("A4", (842, 595)),
+    ("A3", (1191, 842)),
+    ("A2", (1684, 1191)),
+    ("A1", (2384, 1684)),
+    ("A0", (3370, 2384)),
+)
+_LANDSCAPE_PAGE_WIDTHS = tuple(size[0] for _, size in _LANDSCAPE_PAGE_SIZES)
+
+
+def _select_landscape_page_size(required_width):
+    """Return ((width, height), name) of the smallest landscape page at least ``required_width`` wide.
+
+    Wider content gets a custom page rounded up to 50pt, with the A3 landscape
+    height: tables paginate across pages, so the height does not depend on
+    the row count.
+    """
+    idx = bisect_left(_LANDSCAPE_PAGE_WIDTHS, required_width)
+    if idx < len(_LANDSCAPE_PAGE_SIZES):
+        name, size = _LANDSCAPE_PAGE_SIZES[idx]
+        return size, name
+    standard_landscape_height = 842  # A3 landscape height in points
+    custom_width = max(required_width, 842)  # At least A4 width
+    # Round up to nearest 50 points for cleaner dimensions
+    custom_width = ((int(custom_width) + 49) // 50) * 50
+    return (custom_width, standard_landscape_height), f"Custom_{custom_width}x{standard_landscape_height}"
+
+
+def _row_values_getter(keys):
+    """Return a callable that fetches ``keys`` from a row dict as a tuple, in order."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+
+def _format_currency_value(value) -> str:
+    """Format a money cell as "₪ 1,234.56"; non-numeric values pass through as str."""
+    if isinstance(value, (int, float)):
+        return f"₪ {value:,.2f}"
+    return str(value)
+
+
+# Prices and sums repeat across many BOQ rows; the cache is bounded, so it
+# needs no clearing between exports.
+_format_currency_memo = lru_cache(maxsize=8192)(_format_currency_value)
+
+
+def _format_currency_cached(value) -> str:
+    """_format_currency_value memoized by value.
+
+    0.0 and -0.0 are equal cache keys but print differently ("₪ 0.00" vs
+    "₪ -0.00"), so zeros are always formatted directly.
+    """
+    if value == 0:
+        return _format_currency_value(value)
+    return _format_currency_memo(value)
+
+
+def _format_boq_quantity(value) -> str:
+    """Format a BOQ quantity cell: whole numbers without decimals, others with two."""
+    if isinstance(value, (int, float)):
+        return f"{value:,.2f}" if value != int(value) else str(int(value))
+    return str(value)
+
+
+def _is_boq_currency_key(key: str) -> bool:
+    """True when a BOQ items column holds money (prices, sums, totals), not quantities."""
+    key_lower = key.lower()
+    return (
+        "total" in key_lower or "sum" in key_lower or "price" in key_lower
+    ) and not key.endswith("_quantity")
+
 
 class PDFService:
     def __init__(self, exports_dir: Path = None):
         self.exports_dir = exports_dir or Path("exports")
         self.exports_dir.mkdir(parents=True, exist_ok=True)
+        # (db_session, ProjectInfo row) from the last _get_project_info lookup
+        self._project_info_cache = None
         self._register_fonts()
     
     def _register_fonts(self):
         """Register fonts including Hebrew-compatible fonts"""
         import platform
-        import os
         
         # Initialize with fallback fonts
         self.hebrew_font = 'Helvetica'
@@ -156,14 +532,8 @@ class PDFService:
     
     def _format_currency(self, value, language="en"):
         """Format currency value with proper shekel symbol handling"""
-        if isinstance(value, (int, float)):
-            if language == "he":
-                # For Hebrew, use NIS instead of shekel symbol to avoid font issues
-                return f"₪ {value:,.2f}"
-            else:
-                # For English, use NIS instead of shekel symbol to avoid font issues
-                return f"₪ {value:,.2f}"
-        return str(value)
+        # Both languages use the shekel symbol (drawn with the Hebrew font)
+        return _format_currency_value(value)
     
     def _is_currency_value(self, text):
         """Check if text contains currency symbols that need special font handling"""
@@ -173,14 +543,11 @@ class PDFService:
     
     def _detect_rtl(self, text):
         """Detect if text contains RTL characters (Hebrew, Arabic, etc.) or currency symbols"""
-        if not text:
+        # Plain ASCII (numbers, codes, English text) holds neither RTL characters nor ₪
+        if not text or text.isascii():
             return False
-        # Check for Hebrew, Arabic, and other RTL characters
-        rtl_pattern = re.compile(r'[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB1D-\uFDFF\uFE70-\uFEFF]')
-        # Also check for shekel symbol (₪) which needs Hebrew font support
-        has_rtl = bool(rtl_pattern.search(text))
-        has_shekel = '₪' in text
-        return has_rtl or has_shekel
+        # The shekel symbol (₪) also needs Hebrew font support
+        return '₪' in text or _RTL_CHARS_RE.search(text) is not None
 
     def _escape_paragraph_text(self, text):
         """Escape text for ReportLab Paragraph markup."""
@@ -257,7 +624,8 @@ class PDFService:
             return text
         
         # Check if text contains only shekel symbol or currency - don't reverse these
-        if text.strip() == '₪' or (text.strip().startswith('₪') and not re.search(r'[\u0590-\u05FF]', text)):
+        stripped = text.strip()
+        if stripped == '₪' or (stripped.startswith('₪') and not _HEBREW_CHARS_RE.search(text)):
             return text
         
         # For Hebrew text, we need to reverse the entire text character by character
@@ -326,8 +694,15 @@ class PDFService:
         language="en",
         font_size=12,
         cell_padding=None,
+        plain_text_cells=False,
     ):
-        """Create a table with robust Hebrew support using Paragraph objects"""
+        """Create a table with robust Hebrew support using Paragraph objects
+
+        With ``plain_text_cells``, body cells (neither the header nor the
+        totals row) holding non-RTL text that fits on one line are kept as
+        plain strings, which draw the same as a one-line Paragraph without
+        its layout pass. Its callers build left-aligned (non-Hebrew) tables.
+        """
         from reportlab.platypus import Paragraph
         from reportlab.lib.styles import ParagraphStyle
 
@@ -361,9 +736,14 @@ class PDFService:
         
         # Convert data to Paragraph objects for better text rendering
         from reportlab.platypus import Flowable
+        # A plain string must fit inside the cell's default 6pt side paddings
+        # (with a point to spare) so it never needs the Paragraph's wrapping
+        plain_text_widths = [width - 13 for width in column_widths] if plain_text_cells else None
+        last_row_idx = len(data) - 1
         paragraph_data = []
         for row_idx, row in enumerate(data):
             paragraph_row = []
+            plain_row = plain_text_widths is not None and 0 < row_idx < last_row_idx
             for col_idx, cell_value in enumerate(row):
                 # Keep existing flowables (e.g. link Paragraphs) as-is
                 if isinstance(cell_value, Flowable):
@@ -375,6 +755,13 @@ class PDFService:
                     wrapped_text = self._wrap_hebrew_text(str(cell_value), col_width)
                     # Use Hebrew paragraph style for Hebrew text
                     paragraph_row.append(Paragraph(wrapped_text, hebrew_style))
+                elif (
+                    plain_row
+                    and cell_value
+                    and col_idx < len(plain_text_widths)
+                    and self._is_plain_text_cell(str(cell_value), font_size, plain_text_widths[col_idx])
+                ):
+                    paragraph_row.append(str(cell_value))
                 else:
                     # Use English paragraph style for non-Hebrew text
                     paragraph_row.append(
@@ -382,8 +769,10 @@ class PDFService:
                     )
             paragraph_data.append(paragraph_row)
         
-        # Create table with Paragraph objects and repeatRows if specified
-        table = Table(
+        # Create table with Paragraph objects and repeatRows if specified.
+        # LongTable only measures the rows that fit on the current page when
+        # splitting, which keeps layout linear for long summaries.
+        table = LongTable(
             paragraph_data,
             colWidths=column_widths,
             repeatRows=repeat_rows,
@@ -393,76 +782,74 @@ class PDFService:
         # Set alignment based on language
         align_mode = 'RIGHT' if language == "he" else 'LEFT'
         
-        # Apply basic table styling
-        table_style = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # Brighter blue for headers
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),  # White text for better contrast
-            ('ALIGN', (0, 0), (-1, -1), align_mode),  # Alignment based on language
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), font_size),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), cell_padding),
-            ('TOPPADDING', (0, 0), (-1, -1), cell_padding),
-            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP')  # Top alignment for multi-line content
-        ]
-        
-        table.setStyle(TableStyle(table_style))
+        table.setStyle(_robust_table_style(align_mode, font_size, cell_padding))
         return table
-    
-    def _prepare_boq_single_line_cell(self, value):
-        """Format a BOQ cell for single-line PDF display."""
-        if value is None or value == "":
-            return ""
-        text = str(value)
-        if self._is_currency_value(text):
-            return text
-        if self._detect_rtl(text):
-            return self._reverse_hebrew_text(text)
-        return text
-
-    def _measure_boq_cell_width(self, value, font_name, font_size, is_header=False):
-        """Measure rendered width for a single-line BOQ cell."""
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-
-        if value is None or value == "":
-            return 0
-
-        text = str(value)
-        display_text = self._prepare_boq_single_line_cell(text)
-        if is_header:
-            if self._detect_rtl(text) or self._is_currency_value(text):
-                return stringWidth(display_text, self.hebrew_font, font_size) * 1.1
-            return stringWidth(display_text, "Helvetica-Bold", font_size)
-
-        if self._detect_rtl(text) or self._is_currency_value(text):
-            return stringWidth(display_text, self.hebrew_font, font_size) * 1.1
 
-        return stringWidth(display_text, font_name, font_size)
-
-    def _calculate_boq_single_line_page_and_columns(self, data):
+    @staticmethod
+    def _is_plain_text_cell(text, font_size, max_width):
+        """True when text draws identically as a plain table string and as a one-line Paragraph."""
+        # Paragraphs collapse runs of whitespace and break lines; plain strings do not
+        if text != " ".join(text.split()):
+            return False
+        return _cached_string_width(text, "Helvetica", font_size) <= max_width
+    
+    def _prepare_boq_single_line_data(self, data):
+        """Prepare every BOQ cell once for both column sizing and drawing.
+
+        Returns (display_rows, special_cells): the single-line display text of
+        each cell (RTL text reversed for drawing) and, per row, the
+        (col_idx, is_rtl) pairs of cells drawn with the Hebrew font (RTL text
+        or currency values).
+        """
+        detect_rtl = self._detect_rtl
+        is_currency_value = self._is_currency_value
+        display_rows = []
+        special_cells = []
+        for row in data:
+            display_row = []
+            specials = []
+            for col_idx, value in enumerate(row):
+                if value is None or value == "":
+                    display_row.append("")
+                    continue
+                text = str(value)
+                is_currency = is_currency_value(text)
+                is_rtl = detect_rtl(text)
+                if is_rtl and not is_currency:
+                    text = self._reverse_hebrew_text(text)
+                if is_rtl or is_currency:
+                    specials.append((col_idx, is_rtl))
+                display_row.append(text)
+            display_rows.append(display_row)
+            special_cells.append(specials)
+        return display_rows, special_cells
+
+    def _calculate_boq_single_line_page_and_columns(self, display_rows, special_cells):
         """Size each column to its widest single-line value and expand the page to fit."""
-        if not data or not data[0]:
+        if not display_rows or not display_rows[0]:
             return landscape(A3), []
 
-        num_cols = len(data[0])
-        column_widths = []
-
-        for col_idx in range(num_cols):
-            max_width = 0
-            for row_idx, row in enumerate(data):
-                if col_idx >= len(row):
+        num_cols = len(display_rows[0])
+        max_widths = [0] * num_cols
+        for row_idx, row in enumerate(display_rows):
+            if row_idx == 0:
+                font_name, font_size = "Helvetica-Bold", BOQ_PDF_HEADER_FONT_SIZE
+            else:
+                font_name, font_size = "Helvetica", BOQ_PDF_FONT_SIZE
+            special_cols = {col_idx for col_idx, _ in special_cells[row_idx]}
+            for col_idx, text in enumerate(row):
+                if col_idx >= num_cols:
+                    break
+                if not text:
                     continue
-                cell_width = self._measure_boq_cell_width(
-                    row[col_idx],
-                    "Helvetica",
-                    BOQ_PDF_HEADER_FONT_SIZE if row_idx == 0 else BOQ_PDF_FONT_SIZE,
-                    is_header=row_idx == 0,
-                )
-                max_width = max(max_width, cell_width)
-            column_widths.append(max_width + BOQ_PDF_CELL_PADDING)
+                # Hebrew-font cells get 10% headroom for shaping differences
+                if col_idx in special_cols:
+                    cell_width = _cached_string_width(text, self.hebrew_font, font_size) * 1.1
+                else:
+                    cell_width = _cached_string_width(text, font_name, font_size)
+                if cell_width > max_widths[col_idx]:
+                    max_widths[col_idx] = cell_width
+        column_widths = [max_width + BOQ_PDF_CELL_PADDING for max_width in max_widths]
 
         table_width = sum(column_widths)
         page_width = table_width + BOQ_PDF_HORIZONTAL_MARGIN
@@ -480,19 +867,18 @@ class PDFService:
 
     def _create_boq_single_line_table(
         self,
-        data,
+        display_rows,
+        special_cells,
         column_widths,
         repeat_rows=1,
         language="en",
     ):
-        """Create a BOQ table with plain single-line cells (no wrapping)."""
-        processed_data = [
-            [self._prepare_boq_single_line_cell(cell) for cell in row]
-            for row in data
-        ]
+        """Create a BOQ table with plain single-line cells (no wrapping).
 
-        table = Table(
-            processed_data,
+        display_rows/special_cells come from _prepare_boq_single_line_data.
+        """
+        table = LongTable(
+            display_rows,
             colWidths=column_widths,
             repeatRows=repeat_rows,
             splitInRow=0,
@@ -510,31 +896,150 @@ class PDFService:
             ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
             ("LEFTPADDING", (0, 0), (-1, -1), 4),
             ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
             ("BACKGROUND", (0, 1), (-1, -2), colors.white),
             ("BACKGROUND", (0, -1), (-1, -1), colors.lightgrey),
             ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
         ]
 
-        for row_idx, row in enumerate(data):
-            for col_idx, cell_value in enumerate(row):
-                if not cell_value:
-                    continue
-                text = str(cell_value)
-                if self._detect_rtl(text) or self._is_currency_value(text):
-                    header_font = self.hebrew_font_bold if row_idx == 0 else self.hebrew_font
+        for row_idx, specials in enumerate(special_cells):
+            cell_font = self.hebrew_font_bold if row_idx == 0 else self.hebrew_font
+            for col_idx, is_rtl in specials:
+                table_style.append(
+                    ("FONTNAME", (col_idx, row_idx), (col_idx, row_idx), cell_font)
+                )
+                if is_rtl:
                     table_style.append(
-                        ("FONTNAME", (col_idx, row_idx), (col_idx, row_idx), header_font)
+                        ("ALIGN", (col_idx, row_idx), (col_idx, row_idx), "RIGHT")
                     )
-                    if self._detect_rtl(text):
-                        table_style.append(
-                            ("ALIGN", (col_idx, row_idx), (col_idx, row_idx), "RIGHT")
-                        )
 
         table.setStyle(TableStyle(table_style))
         return table
 
+    def _draw_boq_single_line_pages(
+        self, doc, display_rows, special_cells, column_widths, language="en", on_page=None
+    ):
+        """Draw a single-line BOQ table straight onto a canvas, one page at a time.
+
+        Mirrors the layout of _create_boq_single_line_table inside ``doc``'s
+        frame (fonts, padding, row heights, grid, repeated header row, totals
+        row) without building Platypus flowables, whose wrap/split passes
+        dominate the cost of very large BOQ exports.
+        """
+        from reportlab.pdfgen.canvas import Canvas
+
+        canvas = Canvas(doc.filename, pagesize=doc.pagesize)
+
+        # SimpleDocTemplate's frame has 6pt padding on every side; the table is centred in it.
+        frame_padding = 6
+        avail_width = doc.width - 2 * frame_padding
+        avail_height = doc.height - 2 * frame_padding
+        table_top = doc.bottomMargin + doc.height - frame_padding
+        x = doc.leftMargin + frame_padding + (avail_width - sum(column_widths)) / 2.0
+        col_positions = [x]
+        for width in column_widths:
+            x += width
+            col_positions.append(x)
+        table_left, table_right = col_positions[0], col_positions[-1]
+
+        # Table cells keep ReportLab's default 12pt leading (FONTSIZE does not
+        # change it) plus 2pt top and bottom padding.
+        leading = 12
+        row_height = leading + 4
+        align_mode = "RIGHT" if language == "he" else "LEFT"
+
+        def prepare_row(row_idx, font_size, base_font, special_font):
+            special = dict(special_cells[row_idx])
+            cells = []
+            for col_idx, text in enumerate(display_rows[row_idx]):
+                if not text:
+                    continue
+                font = base_font
+                align = align_mode
+                if col_idx in special:
+                    font = special_font
+                    if special[col_idx]:
+                        align = "RIGHT"
+                if align == "RIGHT":
+                    cells.append((font, font_size, True, col_positions[col_idx + 1] - 4, text))
+                else:
+                    cells.append((font, font_size, False, col_positions[col_idx] + 4, text))
+            return cells
+
+        last_row = len(display_rows) - 1
+        header_cells = prepare_row(0, BOQ_PDF_HEADER_FONT_SIZE, "Helvetica-Bold", self.hebrew_font_bold)
+        totals_cells = prepare_row(last_row, BOQ_PDF_FONT_SIZE, "Helvetica-Bold", self.hebrew_font)
+
+        current_font = [None]  # reset per page: showPage drops the canvas font
+
+        def draw_cells(cells, row_bottom):
+            for font, font_size, right, text_x, text in cells:
+                # Baseline of a MIDDLE-aligned single line, as Table._drawCell places it.
+                y = row_bottom + (row_height + leading) / 2.0 - font_size
+                if (font, font_size) != current_font[0]:
+                    canvas.setFont(font, font_size, leading)
+                    current_font[0] = (font, font_size)
+                if right:
+                    canvas.drawRightString(text_x, y, text)
+                else:
+                    canvas.drawString(text_x, y, text)
+
+        row_idx = 1
+        totals_drawn = False
+        while not totals_drawn:
+            if on_page:
+                on_page(canvas, doc)
+            current_font[0] = None
+            canvas.saveState()
+            row_lines = [table_top, table_top - row_height]
+            canvas.setFillColor(colors.lightgrey)
+            canvas.rect(table_left, row_lines[1], table_right - table_left, row_height, stroke=0, fill=1)
+            canvas.setFillColor(colors.black)
+            draw_cells(header_cells, row_lines[1])
+
+            used = row_height
+            # Always place at least one row per page, as Table.split does.
+            while row_idx < last_row and (used + row_height <= avail_height or len(row_lines) == 2):
+                used += row_height
+                row_bottom = table_top - used
+                draw_cells(prepare_row(row_idx, BOQ_PDF_FONT_SIZE, "Helvetica", self.hebrew_font), row_bottom)
+                row_lines.append(row_bottom)
+                row_idx += 1
+            if row_idx == last_row and (used + row_height <= avail_height or len(row_lines) == 2):
+                used += row_height
+                row_bottom = table_top - used
+                canvas.setFillColor(colors.lightgrey)
+                canvas.rect(table_left, row_bottom, table_right - table_left, row_height, stroke=0, fill=1)
+                canvas.setFillColor(colors.black)
+                draw_cells(totals_cells, row_bottom)
+                row_lines.append(row_bottom)
+                totals_drawn = True
+
+            canvas.setLineWidth(0.5)
+            canvas.setStrokeColor(colors.black)
+            canvas.setLineCap(1)
+            canvas.setLineJoin(1)
+            canvas.grid(col_positions, row_lines)
+            canvas.restoreState()
+            canvas.showPage()
+        canvas.save()
+
+    def _get_project_info(self, db_session):
+        """ProjectInfo row, queried once per session for the lifetime of this service.
+
+        A service instance serves one request, and bulk concentration sheet
+        exports would otherwise repeat the same query for every sheet.
+        """
+        if not db_session:
+            return None
+        cached = self._project_info_cache
+        if cached is not None and cached[0] is db_session:
+            return cached[1]
+        project_info = db_session.query(models.ProjectInfo).first()
+        self._project_info_cache = (db_session, project_info)
+        return project_info
+
     def _get_project_names(self, db_session=None, sheet_data=None):
         """Get project names (English and Hebrew) from various sources"""
         project_name = ""
@@ -543,8 +1048,7 @@ class PDFService:
         # Always try to get project info from database first for Hebrew project name
         if db_session:
             try:
-                from models import models
-                project_info = db_session.query(models.ProjectInfo).first()
+                project_info = self._get_project_info(db_session)
                 if project_info:
                     if project_info.project_name:
                         project_name = project_info.project_name
@@ -582,40 +1086,49 @@ class PDFService:
             return "Project Name"
     
     def _add_boq_header_footer(self, canvas, doc, project_name, project_name_hebrew):
-        """Add header and footer to BOQ items PDF pages"""
-        canvas.saveState()
-        
-        # Project name in header (top left)
-        if project_name:
-            canvas.setFont("Helvetica-Bold", 36)
-            canvas.drawString(0.5*inch, doc.pagesize[1] - 0.5*inch, project_name)
-        
-        # Hebrew project name in header (top right)
-        if project_name_hebrew:
-            # Use Hebrew-compatible font for Hebrew text
-            is_rtl = self._detect_rtl(project_name_hebrew)
-            if is_rtl:
-                canvas.setFont(self.hebrew_font_bold, 36)
-                # Don't reverse Hebrew text - display as is
-                canvas.drawRightString(doc.pagesize[0] - 0.5*inch, doc.pagesize[1] - 0.5*inch, self._reverse_hebrew_text(project_name_hebrew))
-            else:
+        """Add header and footer to BOQ items PDF pages
+
+        The header/footer is identical on every page, so it is drawn once into
+        a form XObject and each page just references it.
+        """
+        form_name = "boqHeaderFooter"
+        if not canvas.hasForm(form_name):
+            canvas.beginForm(form_name)
+            canvas.saveState()
+            
+            # Project name in header (top left)
+            if project_name:
                 canvas.setFont("Helvetica-Bold", 36)
-                canvas.drawRightString(doc.pagesize[0] - 0.5*inch, doc.pagesize[1] - 0.5*inch, self._reverse_hebrew_text(project_name_hebrew))
-        
-        # Footer with underlined blanks
-        footer_y = 0.5*inch
-        line_y = footer_y - 5
-        
-        # Left side blank
-        canvas.setFont("Helvetica", 9)
-        canvas.drawString(0.5*inch, footer_y, "________________")
-        canvas.line(0.5*inch, line_y, 2*inch, line_y)
-        
-        # Right side blank
-        canvas.drawRightString(doc.pagesize[0] - 0.5*inch, footer_y, "________________")
-        canvas.line(doc.pagesize[0] - 2*inch, line_y, doc.pagesize[0] - 0.5*inch, line_y)
-        
-        canvas.restoreState()
+                canvas.drawString(0.5*inch, doc.pagesize[1] - 0.5*inch, project_name)
+            
+            # Hebrew project name in header (top right)
+            if project_name_hebrew:
+                # Use Hebrew-compatible font for Hebrew text
+                is_rtl = self._detect_rtl(project_name_hebrew)
+                if is_rtl:
+                    canvas.setFont(self.hebrew_font_bold, 36)
+                    # Don't reverse Hebrew text - display as is
+                    canvas.drawRightString(doc.pagesize[0] - 0.5*inch, doc.pagesize[1] - 0.5*inch, self._reverse_hebrew_text(project_name_hebrew))
+                else:
+                    canvas.setFont("Helvetica-Bold", 36)
+                    canvas.drawRightString(doc.pagesize[0] - 0.5*inch, doc.pagesize[1] - 0.5*inch, self._reverse_hebrew_text(project_name_hebrew))
+            
+            # Footer with underlined blanks
+            footer_y = 0.5*inch
+            line_y = footer_y - 5
+            
+            # Left side blank
+            canvas.setFont("Helvetica", 9)
+            canvas.drawString(0.5*inch, footer_y, "________________")
+            canvas.line(0.5*inch, line_y, 2*inch, line_y)
+            
+            # Right side blank
+            canvas.drawRightString(doc.pagesize[0] - 0.5*inch, footer_y, "________________")
+            canvas.line(doc.pagesize[0] - 2*inch, line_y, doc.pagesize[0] - 0.5*inch, line_y)
+            
+            canvas.restoreState()
+            canvas.endForm()
+        canvas.doForm(form_name)
     
     def _add_concentration_header_footer(
         self, canvas, doc, title_text, language="en", title_font_size=24
@@ -715,25 +1228,20 @@ class PDFService:
     def export_concentration_sheets(self, sheets, db_session=None):
         """Export concentration sheets to PDF"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _export_timestamp()
             filename = f"concentration_sheets_{timestamp}.pdf"
             filepath = self.exports_dir / filename
             
             # Get project name for header
             project_name = self._get_project_name(db_session, sheets)
             
-            doc = SimpleDocTemplate(str(filepath), pagesize=A4)
+            pdf_buffer = BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=A4)
             story = []
-            styles = getSampleStyleSheet()
+            styles = _SAMPLE_STYLES
             
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
+            title_style = _SUMMARY_TITLE_STYLE
             story.append(Paragraph("Concentration Sheets Report", title_style))
             story.append(Spacer(1, 12))
             
@@ -758,22 +1266,14 @@ class PDFService:
                 column_widths = self._calculate_column_widths(data, summary_headers, 'A4', 12, 12)
                 
                 table = Table(data, colWidths=column_widths)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                table.setStyle(_CONCENTRATION_SHEET_TOTALS_STYLE)
                 
                 story.append(table)
                 story.append(Spacer(1, 20))
             
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_header_footer(canvas, doc, project_name), 
-                     onLaterPages=lambda canvas, doc: self._add_header_footer(canvas, doc, project_name))
+            header_footer = partial(self._add_header_footer, project_name=project_name)
+            doc.build(story, onFirstPage=header_footer, onLaterPages=header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
             logger.info(f"Generated concentration sheets PDF: {filepath}")
             return str(filepath)
             
@@ -784,8 +1284,6 @@ class PDFService:
     def _calculate_concentration_sheet_page_size(self, entries):
         """Calculate optimal page size for concentration sheet based on content"""
         try:
-            from reportlab.pdfbase.pdfmetrics import stringWidth
-            
             # Base dimensions for the three tables
             # Table 1: Project Information (2 rows, 4 columns)
             project_table_height = 2 * 35  # 2 rows * 35 points per row (including padding)
@@ -836,7 +1334,7 @@ class PDFService:
             
             for header in entries_headers:
                 # Calculate header width
-                header_width = stringWidth(header, header_font, font_size)
+                header_width = _cached_string_width(header, header_font, font_size)
                 
                 # Add some padding for data content (estimate 50% more than header)
                 estimated_width = header_width * 1.5
@@ -936,9 +1434,7 @@ class PDFService:
                 filepath = self.exports_dir / filename
             
             # Get project information from ProjectInfo table
-            project_info = None
-            if db_session:
-                project_info = db_session.query(models.ProjectInfo).first()
+            project_info = self._get_project_info(db_session)
             
             # Define translations for headers based on language
             if language == "he":
@@ -1066,10 +1562,11 @@ class PDFService:
             )
             
             # Add smaller margins (0.75 inches each)
-            doc = SimpleDocTemplate(str(filepath), pagesize=page_size, 
+            pdf_buffer = BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=page_size, 
                                   leftMargin=54, rightMargin=54, topMargin=36, bottomMargin=36)
             story = []
-            styles = getSampleStyleSheet()
+            styles = _SAMPLE_STYLES
             story.append(Spacer(1, section_spacer))
             # Combined Table: Project Information and BOQ Item Details (2 columns layout)
             # Left column: Project Name, Contract No, Section Number, Unit, Description
@@ -1450,6 +1947,7 @@ class PDFService:
                 )
 
             doc.build(story, onFirstPage=_draw_header_footer, onLaterPages=_draw_header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
             logger.info(f"Generated concentration sheet PDF with RTL layout: {filepath}")
             return str(filepath)
             
@@ -1516,15 +2014,10 @@ class PDFService:
     def export_summary(self, summary_data, db_session=None, language="en"):
         """Export summary report to PDF with language support"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _export_timestamp()
             filename = f"summary_report_{timestamp}.pdf"
             filepath = self.exports_dir / filename
             
-            # Get project information from ProjectInfo table
-            project_info = None
-            if db_session:
-                project_info = db_session.query(models.ProjectInfo).first()
-            
             # Define translations based on language
             if language == "he":
                 # Hebrew translations
@@ -1552,17 +2045,11 @@ class PDFService:
                 grand_total_text = "GRAND TOTAL"
             
             # Get project name for title
-            if language == "he":
-                project_name = (project_info.project_name_hebrew if project_info and project_info.project_name_hebrew 
-                               else project_info.project_name if project_info 
-                               else "דוח סיכום BOQ")
-            else:
-                project_name = (project_info.project_name if project_info and project_info.project_name
-                               else "BOQ Summary Report")
+            project_name = self._get_summary_project_name(db_session, language, title_text)
             
-            doc = SimpleDocTemplate(str(filepath), pagesize=landscape(A4))
+            pdf_buffer = BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=landscape(A4))
             story = []
-            styles = getSampleStyleSheet()
             
             # Create table for summary data with translated headers
             headers = ['Sub-chapter', 'Items', 'Total Estimate', 'Total Submitted', 'Total PNIMI', 'Total Approved']
@@ -1577,14 +2064,15 @@ class PDFService:
                 'approved': 0.0
             }
             
+            fmt = _format_currency_cached
             for row in summary_data:
                 data.append([
                     row.subsection,
                     str(row.item_count),
-                    self._format_currency(row.total_estimate),
-                    self._format_currency(row.total_submitted),
-                    self._format_currency(row.total_pnimi),
-                    self._format_currency(row.total_approved)
+                    fmt(row.total_estimate),
+                    fmt(row.total_submitted),
+                    fmt(row.total_pnimi),
+                    fmt(row.total_approved)
                 ])
                 
                 grand_totals['items'] += row.item_count
@@ -1597,10 +2085,10 @@ class PDFService:
             data.append([
                 grand_total_text,
                 str(grand_totals['items']),
-                self._format_currency(grand_totals['estimate']),
-                self._format_currency(grand_totals['submitted']),
-                self._format_currency(grand_totals['pnimi']),
-                self._format_currency(grand_totals['approved'])
+                fmt(grand_totals['estimate']),
+                fmt(grand_totals['submitted']),
+                fmt(grand_totals['pnimi']),
+                fmt(grand_totals['approved'])
             ])
             
             # Calculate optimal column widths based on content
@@ -1608,42 +2096,17 @@ class PDFService:
             
             # Use Hebrew-aware table creation
             try:
-                table = self._create_robust_hebrew_table(data, translated_headers, column_widths, repeat_rows=1)
+                table = self._create_robust_hebrew_table(
+                    data, translated_headers, column_widths, repeat_rows=1, plain_text_cells=True
+                )
                 logger.info("Successfully created robust Hebrew table for summary with repeatRows")
             except Exception as e:
                 logger.warning(f"Failed to create robust Hebrew table, falling back to regular table: {e}")
-                table = Table(data, colWidths=column_widths, repeatRows=1)
                 table_style, processed_data = self._create_hebrew_aware_table_style(data, translated_headers, column_widths)
                 
-                # Set alignment based on language
-                if language == "he":
-                    # Hebrew mode: right-aligned
-                    table_style.extend([
-                        ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # Bright gray for header row
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),  # Black text for better contrast
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -2), colors.white),  # White background for data rows
-                        ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                    ])
-                else:
-                    # English mode: left-aligned
-                    table_style.extend([
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # Bright gray for header row
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),  # Black text for better contrast
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -2), colors.white),  # White background for data rows
-                        ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                    ])
+                # Set alignment based on language (Hebrew right-aligned, English left-aligned)
+                table_style.append(('ALIGN', (0, 0), (-1, -1), 'RIGHT' if language == "he" else 'LEFT'))
+                table_style.extend(_BOQ_SUMMARY_FALLBACK_STYLE_COMMANDS)
                 
                 table = Table(processed_data, colWidths=column_widths)
                 table.setStyle(TableStyle(table_style))
@@ -1651,8 +2114,11 @@ class PDFService:
             story.append(table)
             
             # Use the same header approach as concentration sheets
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language), 
-                     onLaterPages=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language))
+            header_footer = partial(
+                self._add_concentration_header_footer, title_text=project_name, language=language
+            )
+            doc.build(story, onFirstPage=header_footer, onLaterPages=header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
             logger.info(f"Generated summary PDF with {language} layout: {filepath}")
             return str(filepath)
             
@@ -1660,602 +2126,160 @@ class PDFService:
             logger.error(f"Error generating summary PDF: {str(e)}")
             raise
 
-    def export_structures_summary(self, summaries, db_session=None, language="en"):
-        """Export structures summary to PDF with language support"""
+    def _build_summary_rows(self, summaries, raw_headers, grand_total_text):
+        """Format summary rows and accumulate grand totals in a single pass.
+
+        Column classification (currency vs plain number) is computed once per
+        header instead of once per cell. Returns (rows, totals_row).
+        """
+        fmt = _format_currency_cached
+        is_currency = [_is_summary_currency_key(key) for key in raw_headers]
+        first_row = summaries[0]
+        # Grand totals are kept by column position; only columns that are
+        # numeric in the first row are summed.
+        sum_positions = [
+            i for i, key in enumerate(raw_headers) if isinstance(first_row[key], (int, float))
+        ]
+        grand_totals = [0] * len(raw_headers)
+
+        # _format_currency_value and str() both pass non-numeric values
+        # through as str(value), so each column gets one formatter and only
+        # the totals columns need a per-cell type check.
+        formatters = [fmt if currency else str for currency in is_currency]
+        row_values = _row_values_getter(raw_headers)
+        rows = [None] * len(summaries)
+        for row_idx, summary in enumerate(summaries):
+            values = row_values(summary)
+            rows[row_idx] = [format_value(value) for format_value, value in zip(formatters, values)]
+            for i in sum_positions:
+                value = values[i]
+                if isinstance(value, (int, float)):
+                    grand_totals[i] += value
+
+        totals_row = [""] * len(raw_headers)
+        if raw_headers:
+            totals_row[0] = grand_total_text  # Only add grand total text in first column
+        for i in sum_positions:
+            total = grand_totals[i]
+            totals_row[i] = fmt(total) if is_currency[i] else str(total)
+        return rows, totals_row
+
+    def _get_summary_project_name(self, db_session, language, title_text):
+        """Project name for a summary report header, falling back to the title"""
+        # Get project information from ProjectInfo table
+        project_info = self._get_project_info(db_session)
+        
+        # Get project name for title
+        if language == "he":
+            return (project_info.project_name_hebrew if project_info and project_info.project_name_hebrew 
+                    else project_info.project_name if project_info 
+                    else title_text)
+        return (project_info.project_name if project_info and project_info.project_name
+                else title_text)
+
+    def _export_entity_summary(self, kind, summaries, db_session=None, language="en"):
+        """Export a structures/systems/subsections summary to PDF with language support
+
+        ``kind`` selects the title, grand-total label, file name and log wording.
+        """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"structures_summary_{timestamp}.pdf"
+            timestamp = _export_timestamp()
+            filename = f"{kind}_summary_{timestamp}.pdf"
             filepath = self.exports_dir / filename
             
-            # Get project name for header
-            project_name = self._get_project_name(db_session, summaries)
+            grand_total_text, title_text = _summary_context(kind, language)
             
-            # Define translations for headers based on language
-            if language == "he":
-                # Hebrew translations for structures summary
-                headers_translations = {
-                    'structure': 'מבנה',
-                    'description': 'תיאור',
-                    'total_contract_sum': 'סה"כ חוזה',
-                    'total_estimate': 'סה"כ מחושב',
-                    'total_submitted': 'סה״כ מוגש',
-                    'internal_total': 'סה"כ פנימי',
-                    'total_approved': 'סה"כ מאושר',
-                    'approved_signed_total': 'סה"כ מאושר חתום',
-                    'partial_submitted_total': 'סה"כ מוגש חלקי',
-                    'item_count': 'מספר פריטים'
-                }
-                grand_total_text = "סה\"כ כללי"
+            # Get project name for header
+            if kind == "structures":
+                project_name = self._get_project_name(db_session, summaries)
             else:
-                # English (default)
-                headers_translations = {
-                    'structure': 'Structure',
-                    'description': 'Description',
-                    'total_contract_sum': 'Total Contract Sum',
-                    'total_estimate': 'Total Estimate',
-                    'total_submitted': 'Total Submitted',
-                    'internal_total': 'Internal Total',
-                    'total_approved': 'Total Approved',
-                    'approved_signed_total': 'Approved Signed Total',
-                    'partial_submitted_total': 'Total Partially Submitted',
-                    'item_count': 'Item Count'
-                }
-                grand_total_text = "GRAND TOTAL"
+                project_name = self._get_summary_project_name(db_session, language, title_text)
             
             # Calculate optimal page size and column widths based on content
             if summaries:
                 raw_headers = list(summaries[0].keys())
                 # Translate headers
-                headers = [headers_translations.get(header, header) for header in raw_headers]
+                headers = list(_translate_summary_headers(language, tuple(raw_headers)))
+                
+                rows, totals_row = self._build_summary_rows(summaries, raw_headers, grand_total_text)
                 
                 # Prepare data for size calculation (headers + sample data + totals row)
-                calc_data = [headers]
-                for summary in summaries[:10]:  # Use first 10 items for calculation to avoid too large pages
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    calc_data.append(row_data)
+                # Use first 10 items for calculation to avoid too large pages
+                calc_data = [headers] + rows[:10]
                 
                 # Add a sample totals row for calculation
                 calc_data.append([grand_total_text] + [""] * (len(headers) - 1))
                 
                 # Calculate optimal page size
                 page_size, page_name, column_widths = self._calculate_optimal_page_size(headers, calc_data, font_size=8)
-                logger.info(f"Calculated optimal page size: {page_name} for {len(summaries)} structures")
+                logger.info(f"Calculated optimal page size: {page_name} for {len(summaries)} {kind}")
             else:
                 # Default to A4 landscape if no summaries
                 page_size = landscape(A4)
                 column_widths = None
             
-            doc = SimpleDocTemplate(str(filepath), pagesize=page_size)
+            pdf_buffer = BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=page_size)
             story = []
-            styles = getSampleStyleSheet()
             
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            # Use language-specific title
-            if language == "he":
-                title_text = "דוח סיכום מבנים"
-            else:
-                title_text = "Structures Summary Report"
+            title_style = _SUMMARY_TITLE_STYLE
             
             story.append(Paragraph(title_text, title_style))
             story.append(Spacer(1, 12))
             
             # Create table for summary data
             if summaries:
-                # Use the same raw_headers and translated headers from above
-                raw_headers = list(summaries[0].keys())
-                headers = [headers_translations.get(header, header) for header in raw_headers]
-                data = [headers]
-                
-                grand_totals = {key: 0 if isinstance(summaries[0][key], (int, float)) else "" for key in raw_headers}
-                
-                for summary in summaries:
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    data.append(row_data)
-                    
-                    # Calculate grand totals
-                    for key in raw_headers:  # Use raw headers for data access
-                        if isinstance(summary[key], (int, float)):
-                            grand_totals[key] += summary[key]
-                
-                # Add grand totals row
-                totals_row = []
-                for i, key in enumerate(raw_headers):  # Use raw headers for data access
-                    if isinstance(grand_totals[key], (int, float)):
-                        if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                            totals_row.append(self._format_currency(grand_totals[key]))
-                        else:
-                            totals_row.append(str(grand_totals[key]))
-                    else:
-                        if i == 0:  # Only add grand total text in first column
-                            totals_row.append(grand_total_text)
-                        else:
-                            totals_row.append("")
-                data.append(totals_row)
+                # Use the same headers and formatted rows from above
+                data = [headers] + rows + [totals_row]
                 
                 # Try to use robust Hebrew table method first, fallback to regular table if it fails
                 try:
-                    table = self._create_robust_hebrew_table(data, headers, column_widths, repeat_rows=1)
-                    logger.info("Successfully created robust Hebrew table for structures summary with repeatRows")
+                    table = self._create_robust_hebrew_table(
+                        data, headers, column_widths, repeat_rows=1, plain_text_cells=True
+                    )
+                    logger.info(f"Successfully created robust Hebrew table for {kind} summary with repeatRows")
                 except Exception as e:
                     logger.warning(f"Failed to create robust Hebrew table, falling back to regular table: {e}")
-                    table = Table(data, colWidths=column_widths, repeat_rows=1)
                     table_style, processed_data = self._create_hebrew_aware_table_style(data, headers, column_widths)
-                    
-                    # Set alignment based on language
-                    if language == "he":
-                        # Hebrew mode: right-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    else:
-                        # English mode: left-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    
+                
+                    # Set alignment based on language (Hebrew right-aligned, English left-aligned)
+                    table_style.append(('ALIGN', (0, 0), (-1, -1), 'RIGHT' if language == "he" else 'LEFT'))
+                    table_style.extend(_SUMMARY_FALLBACK_STYLE_COMMANDS)
+                
                     table = Table(processed_data, colWidths=column_widths)
                     table.setStyle(TableStyle(table_style))
                 
                 story.append(table)
             
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language), 
-                     onLaterPages=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language))
-            logger.info(f"Generated structures summary PDF with {language} layout: {filepath}")
+            header_footer = partial(
+                self._add_concentration_header_footer, title_text=project_name, language=language
+            )
+            doc.build(story, onFirstPage=header_footer, onLaterPages=header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
+            logger.info(f"Generated {kind} summary PDF with {language} layout: {filepath}")
             return str(filepath)
             
         except Exception as e:
-            logger.error(f"Error generating structures summary PDF: {str(e)}")
+            logger.error(f"Error generating {kind} summary PDF: {str(e)}")
             raise
 
+    def export_structures_summary(self, summaries, db_session=None, language="en"):
+        """Export structures summary to PDF with language support"""
+        return self._export_entity_summary("structures", summaries, db_session, language)
+
     def export_systems_summary(self, summaries, db_session=None, language="en"):
         """Export systems summary to PDF with language support"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"systems_summary_{timestamp}.pdf"
-            filepath = self.exports_dir / filename
-            
-            # Get project information from ProjectInfo table
-            project_info = None
-            if db_session:
-                project_info = db_session.query(models.ProjectInfo).first()
-            
-            # Get project name for title
-            if language == "he":
-                project_name = (project_info.project_name_hebrew if project_info and project_info.project_name_hebrew 
-                               else project_info.project_name if project_info 
-                               else "דוח סיכום מערכות")
-            else:
-                project_name = (project_info.project_name if project_info and project_info.project_name
-                               else "Systems Summary Report")
-            
-            # Define translations for headers based on language
-            if language == "he":
-                # Hebrew translations for systems summary
-                headers_translations = {
-                    'system': 'מערכת',
-                    'description': 'תיאור',
-                    'total_contract_sum': 'סה"כ חוזה',
-                    'total_estimate': 'סה"כ מחושב',
-                    'total_submitted': 'סה״כ מוגש',
-                    'internal_total': 'סה"כ פנימי',
-                    'total_approved': 'סה"כ מאושר',
-                    'approved_signed_total': 'סה"כ מאושר חתום',
-                    'partial_submitted_total': 'סה"כ מוגש חלקי',
-                    'item_count': 'מספר פריטים'
-                }
-                grand_total_text = "סה\"כ כללי"
-            else:
-                # English (default)
-                headers_translations = {
-                    'system': 'System',
-                    'description': 'Description',
-                    'total_contract_sum': 'Total Contract Sum',
-                    'total_estimate': 'Total Estimate',
-                    'total_submitted': 'Total Submitted',
-                    'internal_total': 'Internal Total',
-                    'total_approved': 'Total Approved',
-                    'approved_signed_total': 'Approved Signed Total',
-                    'partial_submitted_total': 'Total Partially Submitted',
-                    'item_count': 'Item Count'
-                }
-                grand_total_text = "GRAND TOTAL"
-            
-            # Calculate optimal page size and column widths based on content
-            if summaries:
-                raw_headers = list(summaries[0].keys())
-                # Translate headers
-                headers = [headers_translations.get(header, header) for header in raw_headers]
-                
-                # Prepare data for size calculation (headers + sample data + totals row)
-                calc_data = [headers]
-                for summary in summaries[:10]:  # Use first 10 items for calculation to avoid too large pages
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    calc_data.append(row_data)
-                
-                # Add a sample totals row for calculation
-                calc_data.append([grand_total_text] + [""] * (len(headers) - 1))
-                
-                # Calculate optimal page size
-                page_size, page_name, column_widths = self._calculate_optimal_page_size(headers, calc_data, font_size=8)
-                logger.info(f"Calculated optimal page size: {page_name} for {len(summaries)} systems")
-            else:
-                # Default to A4 landscape if no summaries
-                page_size = landscape(A4)
-                column_widths = None
-            
-            doc = SimpleDocTemplate(str(filepath), pagesize=page_size)
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            # Use language-specific title
-            if language == "he":
-                title_text = "דוח סיכום מערכות"
-            else:
-                title_text = "Systems Summary Report"
-            
-            story.append(Paragraph(title_text, title_style))
-            story.append(Spacer(1, 12))
-            
-            # Create table for summary data
-            if summaries:
-                # Use the same raw_headers and translated headers from above
-                raw_headers = list(summaries[0].keys())
-                headers = [headers_translations.get(header, header) for header in raw_headers]
-                data = [headers]
-                
-                grand_totals = {key: 0 if isinstance(summaries[0][key], (int, float)) else "" for key in raw_headers}
-                
-                for summary in summaries:
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    data.append(row_data)
-                    
-                    # Calculate grand totals
-                    for key in raw_headers:  # Use raw headers for data access
-                        if isinstance(summary[key], (int, float)):
-                            grand_totals[key] += summary[key]
-                
-                # Add grand totals row
-                totals_row = []
-                for i, key in enumerate(raw_headers):  # Use raw headers for data access
-                    if isinstance(grand_totals[key], (int, float)):
-                        if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                            totals_row.append(self._format_currency(grand_totals[key]))
-                        else:
-                            totals_row.append(str(grand_totals[key]))
-                    else:
-                        if i == 0:  # Only add grand total text in first column
-                            totals_row.append(grand_total_text)
-                        else:
-                            totals_row.append("")
-                data.append(totals_row)
-                
-                # Try to use robust Hebrew table method first, fallback to regular table if it fails
-                try:
-                    table = self._create_robust_hebrew_table(data, headers, column_widths, repeat_rows=1)
-                    logger.info("Successfully created robust Hebrew table for systems summary with repeatRows")
-                except Exception as e:
-                    logger.warning(f"Failed to create robust Hebrew table, falling back to regular table: {e}")
-                    table = Table(data, colWidths=column_widths, repeat_rows=1)
-                    table_style, processed_data = self._create_hebrew_aware_table_style(data, headers, column_widths)
-                    
-                    # Set alignment based on language
-                    if language == "he":
-                        # Hebrew mode: right-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    else:
-                        # English mode: left-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    
-                    table = Table(processed_data, colWidths=column_widths)
-                    table.setStyle(TableStyle(table_style))
-                
-                story.append(table)
-            
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language), 
-                     onLaterPages=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language))
-            logger.info(f"Generated systems summary PDF with {language} layout: {filepath}")
-            return str(filepath)
-            
-        except Exception as e:
-            logger.error(f"Error generating systems summary PDF: {str(e)}")
-            raise
+        return self._export_entity_summary("systems", summaries, db_session, language)
 
     def export_subsections_summary(self, summaries, db_session=None, language="en"):
         """Export subsections summary to PDF with language support"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"subsections_summary_{timestamp}.pdf"
-            filepath = self.exports_dir / filename
-            
-            # Get project information from ProjectInfo table
-            project_info = None
-            if db_session:
-                project_info = db_session.query(models.ProjectInfo).first()
-            
-            # Get project name for title
-            if language == "he":
-                project_name = (project_info.project_name_hebrew if project_info and project_info.project_name_hebrew 
-                               else project_info.project_name if project_info 
-                               else "דוח סיכום תת-פרקים")
-            else:
-                project_name = (project_info.project_name if project_info and project_info.project_name
-                               else "Subsections Summary Report")
-            
-            # Define translations for headers based on language
-            if language == "he":
-                # Hebrew translations for subsections summary
-                headers_translations = {
-                    'subsection': 'תת-פרק',
-                    'description': 'תיאור',
-                    'total_contract_sum': 'סה"כ חוזה',
-                    'total_estimate': 'סה"כ מחושב',
-                    'total_submitted': 'סה״כ מוגש',
-                    'internal_total': 'סה"כ פנימי',
-                    'total_approved': 'סה"כ מאושר',
-                    'approved_signed_total': 'סה"כ מאושר חתום',
-                    'partial_submitted_total': 'סה"כ מוגש חלקי',
-                    'item_count': 'מספר פריטים'
-                }
-                grand_total_text = "סה\"כ כללי"
-            else:
-                # English (default)
-                headers_translations = {
-                    'subsection': 'Subsection',
-                    'description': 'Description',
-                    'total_contract_sum': 'Total Contract Sum',
-                    'total_estimate': 'Total Estimate',
-                    'total_submitted': 'Total Submitted',
-                    'internal_total': 'Internal Total',
-                    'total_approved': 'Total Approved',
-                    'approved_signed_total': 'Approved Signed Total',
-                    'partial_submitted_total': 'Total Partially Submitted',
-                    'item_count': 'Item Count'
-                }
-                grand_total_text = "GRAND TOTAL"
-            
-            # Calculate optimal page size and column widths based on content
-            if summaries:
-                raw_headers = list(summaries[0].keys())
-                # Translate headers
-                headers = [headers_translations.get(header, header) for header in raw_headers]
-                
-                # Prepare data for size calculation (headers + sample data + totals row)
-                calc_data = [headers]
-                for summary in summaries[:10]:  # Use first 10 items for calculation to avoid too large pages
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    calc_data.append(row_data)
-                
-                # Add a sample totals row for calculation
-                calc_data.append([grand_total_text] + [""] * (len(headers) - 1))
-                
-                # Calculate optimal page size
-                page_size, page_name, column_widths = self._calculate_optimal_page_size(headers, calc_data, font_size=8)
-                logger.info(f"Calculated optimal page size: {page_name} for {len(summaries)} subsections")
-            else:
-                # Default to A4 landscape if no summaries
-                page_size = landscape(A4)
-                column_widths = None
-            
-            doc = SimpleDocTemplate(str(filepath), pagesize=page_size)
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            # Use language-specific title
-            if language == "he":
-                title_text = "דוח סיכום תת-פרקים"
-            else:
-                title_text = "Subsections Summary Report"
-            
-            story.append(Paragraph(title_text, title_style))
-            story.append(Spacer(1, 12))
-            
-            # Create table for summary data
-            if summaries:
-                # Use the same raw_headers and translated headers from above
-                raw_headers = list(summaries[0].keys())
-                headers = [headers_translations.get(header, header) for header in raw_headers]
-                data = [headers]
-                
-                grand_totals = {key: 0 if isinstance(summaries[0][key], (int, float)) else "" for key in raw_headers}
-                
-                for summary in summaries:
-                    row_data = []
-                    for key in raw_headers:  # Use raw headers for data access
-                        value = summary[key]
-                        if isinstance(value, (int, float)):
-                            if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(str(value))
-                        else:
-                            row_data.append(str(value))
-                    data.append(row_data)
-                    
-                    # Calculate grand totals
-                    for key in raw_headers:  # Use raw headers for data access
-                        if isinstance(summary[key], (int, float)):
-                            grand_totals[key] += summary[key]
-                
-                # Add grand totals row
-                totals_row = []
-                for i, key in enumerate(raw_headers):  # Use raw headers for data access
-                    if isinstance(grand_totals[key], (int, float)):
-                        if 'total' in key.lower() or 'estimate' in key.lower() or 'submitted' in key.lower() or 'approved' in key.lower():
-                            totals_row.append(self._format_currency(grand_totals[key]))
-                        else:
-                            totals_row.append(str(grand_totals[key]))
-                    else:
-                        if i == 0:  # Only add grand total text in first column
-                            totals_row.append(grand_total_text)
-                        else:
-                            totals_row.append("")
-                data.append(totals_row)
-                
-                # Try to use robust Hebrew table method first, fallback to regular table if it fails
-                try:
-                    table = self._create_robust_hebrew_table(data, headers, column_widths, repeat_rows=1)
-                    logger.info("Successfully created robust Hebrew table for subsections summary with repeatRows")
-                except Exception as e:
-                    logger.warning(f"Failed to create robust Hebrew table, falling back to regular table: {e}")
-                    table = Table(data, colWidths=column_widths, repeat_rows=1)
-                    table_style, processed_data = self._create_hebrew_aware_table_style(data, headers, column_widths)
-                    
-                    # Set alignment based on language
-                    if language == "he":
-                        # Hebrew mode: right-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    else:
-                        # English mode: left-aligned
-                        table_style.extend([
-                            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                            ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
-                            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ])
-                    
-                    table = Table(processed_data, colWidths=column_widths)
-                    table.setStyle(TableStyle(table_style))
-                
-                story.append(table)
-            
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language), 
-                     onLaterPages=lambda canvas, doc: self._add_concentration_header_footer(canvas, doc, project_name, language))
-            logger.info(f"Generated subsections summary PDF with {language} layout: {filepath}")
-            return str(filepath)
-            
-        except Exception as e:
-            logger.error(f"Error generating subsections summary PDF: {str(e)}")
-            raise
+        return self._export_entity_summary("subsections", summaries, db_session, language)
 
     def export_boq_items(self, items, db_session=None, language="en"):
         """Export BOQ items to PDF with language support"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _export_timestamp()
             filename = f"boq_items_{timestamp}.pdf"
             filepath = self.exports_dir / filename
             
@@ -2322,93 +2346,78 @@ class PDFService:
 
             page_size = landscape(A3)
             column_widths = None
-            data = None
+            display_rows = special_cells = None
 
             if items:
-                all_possible_headers = [
-                    'serial_number', 'structure', 'system', 'section_number', 'description', 'unit',
-                    'original_contract_quantity'
-                ]
-
-                for key in items[0].keys():
+                # Contract-update columns are collected in one pass over the item keys
+                item_keys = items[0].keys()
+                quantity_update_keys = []
+                sum_update_keys = []
+                for key in item_keys:
                     if key.startswith('updated_contract_quantity_'):
-                        all_possible_headers.append(key)
-
-                all_possible_headers.append('price')
-
-                for key in items[0].keys():
-                    if key.startswith('updated_contract_sum_'):
-                        all_possible_headers.append(key)
-
-                all_possible_headers.extend([
-                    'total_contract_sum', 'estimated_quantity', 'quantity_submitted', 'internal_quantity',
-                    'approved_by_project_manager', 'approved_signed_quantity',
-                    'partially_submitted_quantity', 'total_estimate',
-                    'total_submitted', 'internal_total', 'total_approved_by_project_manager',
-                    'approved_signed_total', 'partial_submitted_total',
-                    'total_decrease', 'total_increase', 'subsection', 'notes'
-                ])
-
-                raw_headers = [h for h in all_possible_headers if h in items[0].keys()]
+                        quantity_update_keys.append(key)
+                    elif key.startswith('updated_contract_sum_'):
+                        sum_update_keys.append(key)
+
+                raw_headers = [
+                    h for h in BOQ_PDF_LEADING_COLUMNS if h in item_keys
+                ] + quantity_update_keys
+                if 'price' in item_keys:
+                    raw_headers.append('price')
+                raw_headers += sum_update_keys
+                raw_headers += [h for h in BOQ_PDF_TRAILING_COLUMNS if h in item_keys]
                 headers = [headers_translations.get(header, header) for header in raw_headers]
 
                 if language == "he":
                     raw_headers = list(reversed(raw_headers))
                     headers = list(reversed(headers))
 
-                data = [headers]
-
-                total_columns = {
-                    'total_contract_sum',
-                    'total_estimate',
-                    'total_submitted',
-                    'internal_total',
-                    'total_approved_by_project_manager',
-                    'approved_signed_total',
-                    'partial_submitted_total',
-                    'total_decrease',
-                    'total_increase'
-                }
-                for key in raw_headers:
-                    if key.startswith('updated_contract_sum_'):
-                        total_columns.add(key)
-
-                grand_totals = {
-                    key: 0 if isinstance(items[0][key], (int, float)) else ""
-                    for key in raw_headers
-                }
+                total_columns = BOQ_PDF_TOTAL_COLUMNS.union(sum_update_keys)
 
-                for item in items:
-                    row_data = []
-                    for key in raw_headers:
-                        value = item[key]
-                        if isinstance(value, (int, float)):
-                            if ('total' in key.lower() or 'sum' in key.lower() or 'price' in key.lower()) and not str(key).endswith('_quantity'):
-                                row_data.append(self._format_currency(value))
-                            else:
-                                row_data.append(f"{value:,.2f}" if value != int(value) else str(int(value)))
-                        else:
-                            row_data.append(str(value))
-                    data.append(row_data)
-
-                    for key in raw_headers:
-                        if key in total_columns and isinstance(item[key], (int, float)):
-                            grand_totals[key] += item[key]
-
-                totals_row = []
-                for i, key in enumerate(raw_headers):
-                    if i == 0:
-                        totals_row.append("סה\"כ כולל" if language == "he" else "GRAND TOTAL")
-                    elif key in total_columns and isinstance(grand_totals[key], (int, float)):
-                        totals_row.append(self._format_currency(grand_totals[key]))
-                    else:
-                        totals_row.append("")
-                data.append(totals_row)
+                fmt = _format_currency_cached
+                first_item = items[0]
+                sum_positions = [
+                    i
+                    for i, key in enumerate(raw_headers)
+                    if key in total_columns and isinstance(first_item[key], (int, float))
+                ]
+                grand_totals = [0] * len(raw_headers)
 
-                page_size, column_widths = self._calculate_boq_single_line_page_and_columns(data)
+                # Both formatters check each value's type and pass non-numbers
+                # through as str(value), so a column may mix text and numbers.
+                formatters = [
+                    fmt if _is_boq_currency_key(key) else _format_boq_quantity
+                    for key in raw_headers
+                ]
+                row_values = _row_values_getter(raw_headers)
+
+                def formatted_rows():
+                    """Yield the header row, each formatted item row, then the totals row."""
+                    yield headers
+                    for item in items:
+                        values = row_values(item)
+                        for i in sum_positions:
+                            value = values[i]
+                            if isinstance(value, (int, float)):
+                                grand_totals[i] += value
+                        yield [format_value(value) for format_value, value in zip(formatters, values)]
+
+                    totals_row = [""] * len(raw_headers)
+                    for i in sum_positions:
+                        totals_row[i] = fmt(grand_totals[i])
+                    totals_row[0] = "סה\"כ כולל" if language == "he" else "GRAND TOTAL"
+                    yield totals_row
+
+                # Rows are prepared for display as they are formatted, so a large
+                # BOQ never holds both the formatted and the display copy at once.
+                display_rows, special_cells = self._prepare_boq_single_line_data(formatted_rows())
+                page_size, column_widths = self._calculate_boq_single_line_page_and_columns(
+                    display_rows, special_cells
+                )
 
+            pdf_buffer = BytesIO()
             doc = SimpleDocTemplate(
-                str(filepath),
+                pdf_buffer,
                 pagesize=page_size,
                 leftMargin=54,
                 rightMargin=54,
@@ -2417,17 +2426,37 @@ class PDFService:
             )
             story = []
 
-            if data and column_widths:
+            header_footer = partial(
+                self._add_boq_header_footer,
+                project_name=project_name,
+                project_name_hebrew=project_name_hebrew,
+            )
+
+            if (
+                display_rows
+                and column_widths
+                and len(items) >= BOQ_PDF_CANVAS_MIN_ROWS
+                and not any("\n" in text for row in display_rows for text in row)
+            ):
+                # Large exports skip Platypus table layout and draw rows directly.
+                # The canvas path draws one line per row, so multi-line cells
+                # keep the table, which splits them into lines and sizes rows.
+                self._draw_boq_single_line_pages(
+                    doc, display_rows, special_cells, column_widths, language, on_page=header_footer
+                )
+                _write_pdf_file(filepath, pdf_buffer)
+                logger.info(f"Generated BOQ items PDF ({len(items)} rows, direct canvas): {filepath}")
+                return str(filepath)
+
+            if display_rows and column_widths:
+                # Exports this short fit comfortably in a single table
                 table = self._create_boq_single_line_table(
-                    data,
-                    column_widths,
-                    repeat_rows=1,
-                    language=language,
+                    display_rows, special_cells, column_widths, repeat_rows=1, language=language
                 )
                 story.append(table)
             
-            doc.build(story, onFirstPage=lambda canvas, doc: self._add_boq_header_footer(canvas, doc, project_name, project_name_hebrew), 
-                     onLaterPages=lambda canvas, doc: self._add_boq_header_footer(canvas, doc, project_name, project_name_hebrew))
+            doc.build(story, onFirstPage=header_footer, onLaterPages=header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
             logger.info(f"Generated BOQ items PDF: {filepath}")
             return str(filepath)
             
@@ -2435,10 +2464,55 @@ class PDFService:
             logger.error(f"Error generating BOQ items PDF: {str(e)}")
             raise
 
+    def _measure_column_widths(self, headers, data, header_font_size, data_font_size, hebrew_padding):
+        """Measure the widest header/cell of each column.
+
+        Returns a (max_width, contains_hebrew) pair per header. RTL and currency
+        cells are measured in the Hebrew font and scaled by ``hebrew_padding``.
+        Cells are normally pre-formatted strings; other values are stringified
+        (None as "").
+        """
+        header_font = 'Helvetica-Bold'
+        data_font = 'Helvetica'
+        hebrew_font = self.hebrew_font
+        # Bound once; the inner loop runs for every cell
+        string_width = _cached_string_width
+        detect_rtl = self._detect_rtl
+        is_currency_value = self._is_currency_value
+        
+        measured_columns = []
+        for col_idx, header in enumerate(headers):
+            # Check header width with bold font
+            max_width = string_width(header, header_font, header_font_size)
+            
+            # Columns repeat units, zeros and blanks; measure each distinct text once
+            column_texts = set()
+            for row in data:
+                if col_idx < len(row):
+                    cell_value = row[col_idx]
+                    if type(cell_value) is not str:
+                        cell_value = str(cell_value) if cell_value is not None else ""
+                    column_texts.add(cell_value)
+            
+            # Check every distinct value of this column, noting Hebrew text on the way
+            contains_hebrew = False
+            for cell_value in column_texts:
+                # Use appropriate font for width calculation
+                is_rtl = detect_rtl(cell_value)
+                contains_hebrew = contains_hebrew or is_rtl
+                if is_rtl or is_currency_value(cell_value):
+                    cell_width = string_width(cell_value, hebrew_font, data_font_size)
+                    cell_width = cell_width * hebrew_padding
+                else:
+                    cell_width = string_width(cell_value, data_font, data_font_size)
+                if cell_width > max_width:
+                    max_width = cell_width
+            
+            measured_columns.append((max_width, contains_hebrew))
+        return measured_columns
+
     def _calculate_column_widths(self, data, headers, page_size_or_width='A3', header_font_size=8, data_font_size=8, language="en"):
         """Calculate optimal column widths based on actual content length"""
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-        
         # Handle both page size strings and direct width values
         if isinstance(page_size_or_width, (int, float)):
             # Direct width value provided
@@ -2530,40 +2604,14 @@ class PDFService:
             logger.info(f"Using fixed percentage widths for concentration entries table ({language}): {[f'{w:.1f}' for w in column_widths]} (Total: {sum(column_widths):.1f}/{available_width:.1f})")
             return column_widths
         
-        # Font settings for width calculation
-        header_font = 'Helvetica-Bold'
-        data_font = 'Helvetica'
-        hebrew_font = self.hebrew_font
-        
         # Calculate maximum width needed for each column based on actual content
+        # (Hebrew text gets extra padding as it often needs more space)
+        measured_columns = self._measure_column_widths(
+            headers, data, header_font_size, data_font_size, hebrew_padding=1.6
+        )
         column_max_widths = []
         
-        for col_idx, header in enumerate(headers):
-            max_width = 0
-            
-            # Check header width with bold font
-            header_width = stringWidth(header, header_font, header_font_size)
-            max_width = max(max_width, header_width)
-            
-            # Check all data rows for this column
-            for row in data:
-                if col_idx < len(row):
-                    cell_value = str(row[col_idx]) if row[col_idx] is not None else ""
-                    # Use appropriate font for width calculation
-                    if self._detect_rtl(cell_value) or self._is_currency_value(cell_value):
-                        cell_width = stringWidth(cell_value, hebrew_font, data_font_size)
-                        # Add extra padding for Hebrew text as it often needs more space
-                        cell_width = cell_width * 1.6
-                    else:
-                        cell_width = stringWidth(cell_value, data_font, data_font_size)
-                    max_width = max(max_width, cell_width)
-            
-            # Check if this column contains Hebrew text
-            contains_hebrew = any(
-                self._detect_rtl(str(row[col_idx])) if col_idx < len(row) and row[col_idx] is not None else False
-                for row in data
-            )
-            
+        for header, (max_width, contains_hebrew) in zip(headers, measured_columns):
             # Determine column type for appropriate width handling
             header_lower = header.lower()
             is_description_column = 'description' in header_lower or 'תיאור' in header
@@ -2599,15 +2647,16 @@ class PDFService:
         # If total width exceeds available width, scale down proportionally but preserve ratios
         if total_width > available_width:
             scale_factor = available_width / total_width
-            column_max_widths = [width * scale_factor for width in column_max_widths]
-            
-            # Ensure minimum width after scaling (reduced to allow more columns)
+            # Scale and ensure minimum width in one pass (reduced to allow more columns)
             min_final_width = 50
-            column_max_widths = [max(min_final_width, width) for width in column_max_widths]
+            column_max_widths = [
+                max(min_final_width, width * scale_factor) for width in column_max_widths
+            ]
             
             # If we still exceed available width after minimums, scale again
-            if sum(column_max_widths) > available_width:
-                final_scale = available_width / sum(column_max_widths)
+            scaled_width = sum(column_max_widths)
+            if scaled_width > available_width:
+                final_scale = available_width / scaled_width
                 column_max_widths = [width * final_scale for width in column_max_widths]
         
         # Log the calculated widths for debugging
@@ -2617,41 +2666,13 @@ class PDFService:
 
     def _calculate_optimal_page_size(self, headers, data, font_size=8):
         """Calculate optimal page size based on content volume"""
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-        
-        # Font settings for width calculation
-        header_font = 'Helvetica-Bold'
-        data_font = 'Helvetica'
-        hebrew_font = self.hebrew_font
-        
         # Calculate maximum width needed for each column
+        measured_columns = self._measure_column_widths(
+            headers, data, font_size, font_size, hebrew_padding=1.3
+        )
         column_max_widths = []
         
-        for col_idx, header in enumerate(headers):
-            max_width = 0
-            
-            # Check header width with bold font
-            header_width = stringWidth(header, header_font, font_size)
-            max_width = max(max_width, header_width)
-            
-            # Check all data rows for this column
-            for row in data:
-                if col_idx < len(row):
-                    cell_value = str(row[col_idx]) if row[col_idx] is not None else ""
-                    # Use appropriate font for width calculation
-                    if self._detect_rtl(cell_value) or self._is_currency_value(cell_value):
-                        cell_width = stringWidth(cell_value, hebrew_font, font_size)
-                        cell_width = cell_width * 1.3  # Extra padding for Hebrew
-                    else:
-                        cell_width = stringWidth(cell_value, data_font, font_size)
-                    max_width = max(max_width, cell_width)
-            
-            # Check if this column contains Hebrew text
-            contains_hebrew = any(
-                self._detect_rtl(str(row[col_idx])) if col_idx < len(row) and row[col_idx] is not None else False
-                for row in data
-            )
-            
+        for header, (max_width, contains_hebrew) in zip(headers, measured_columns):
             # Determine column type for appropriate width handling
             header_lower = header.lower()
             is_description_column = 'description' in header_lower or 'תיאור' in header
@@ -2685,40 +2706,9 @@ class PDFService:
         margin = 72 * 2  # 2 inches total margin
         required_page_width = total_content_width + margin
         
-        # Tables paginate across pages; height is based on a standard landscape page,
-        # not the full row count (sample data may be much smaller than the final export).
-        standard_landscape_height = 842  # A3 landscape height in points
-        required_page_height = standard_landscape_height
-        
-        # Standard page sizes in points (landscape orientation)
-        standard_sizes = {
-            'A4': (842, 595),      # A4 landscape
-            'A3': (1191, 842),     # A3 landscape  
-            'A2': (1684, 1191),    # A2 landscape
-            'A1': (2384, 1684),    # A1 landscape
-            'A0': (3370, 2384),    # A0 landscape
-        }
-        
-        # Find the smallest standard size wide enough for all columns
-        optimal_size = None
-        optimal_name = None
-        
-        for size_name, (width, height) in standard_sizes.items():
-            if width >= required_page_width:
-                optimal_size = (width, height)
-                optimal_name = size_name
-                break
-        
-        # If no standard size fits, create a custom width with standard height
-        if optimal_size is None:
-            custom_width = max(required_page_width, 842)  # At least A4 width
-            
-            # Round up to nearest 50 points for cleaner dimensions
-            custom_width = ((int(custom_width) + 49) // 50) * 50
-            
-            optimal_size = (custom_width, standard_landscape_height)
-            optimal_name = f"Custom_{custom_width}x{standard_landscape_height}"
-            logger.info(f"Using custom page size: {custom_width}x{standard_landscape_height} points")
+        optimal_size, optimal_name = _select_landscape_page_size(required_page_width)
+        if optimal_name.startswith("Custom_"):
+            logger.info(f"Using custom page size: {optimal_size[0]}x{optimal_size[1]} points")
         else:
             logger.info(f"Using standard page size: {optimal_name} ({optimal_size[0]}x{optimal_size[1]} points)")
         
@@ -2727,7 +2717,7 @@ class PDFService:
     def export_non_boq_items(self, rows, db_session=None, language="en"):
         """Export non-BOQ items list to PDF."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _export_timestamp()
             filename = f"non_boq_items_{timestamp}.pdf"
             filepath = self.exports_dir / filename
 
@@ -2743,24 +2733,12 @@ class PDFService:
                 title_text = "Non-BOQ Items"
                 headers = ["No", "Item No", "Calc. Sheet No"]
 
-            doc = SimpleDocTemplate(str(filepath), pagesize=landscape(A4))
+            pdf_buffer = BytesIO()
+            doc = SimpleDocTemplate(pdf_buffer, pagesize=landscape(A4))
             story = []
-            styles = getSampleStyleSheet()
-
-            title_style = ParagraphStyle(
-                "NonBoqTitle",
-                parent=styles["Heading1"],
-                fontSize=16,
-                spaceAfter=12,
-                alignment=1,
-            )
-            subtitle_style = ParagraphStyle(
-                "NonBoqSubtitle",
-                parent=styles["Normal"],
-                fontSize=10,
-                spaceAfter=20,
-                alignment=1,
-            )
+
+            title_style = _NON_BOQ_TITLE_STYLE
+            subtitle_style = _NON_BOQ_SUBTITLE_STYLE
 
             story.append(Paragraph(title_text, title_style))
             story.append(Paragraph(project_name, subtitle_style))
@@ -2776,32 +2754,14 @@ class PDFService:
                 )
 
             table = Table(data, repeatRows=1)
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#366092")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 9),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F5F5F5")]),
-                        ("TOPPADDING", (0, 0), (-1, -1), 6),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ]
-                )
-            )
+            table.setStyle(_NON_BOQ_TABLE_STYLE)
             story.append(table)
 
-            doc.build(
-                story,
-                onFirstPage=lambda canvas, doc: self._add_concentration_header_footer(
-                    canvas, doc, project_name, language
-                ),
-                onLaterPages=lambda canvas, doc: self._add_concentration_header_footer(
-                    canvas, doc, project_name, language
-                ),
+            header_footer = partial(
+                self._add_concentration_header_footer, title_text=project_name, language=language
             )
+            doc.build(story, onFirstPage=header_footer, onLaterPages=header_footer)
+            _write_pdf_file(filepath, pdf_buffer)
             logger.info(f"Generated non-BOQ items PDF: {filepath}")
             return str(filepath)
 
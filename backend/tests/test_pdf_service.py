@@ -0,0 +1,330 @@
+from pathlib import Path
+
+from services.pdf_service import PDFService
+
+
+def _summaries():
+    return [
+        {
+            "structure": "S1",
+            "description": "Main building",
+            "total_estimate": 1000.5,
+            "item_count": 3,
+        },
+        {
+            "structure": "S2",
+            "description": "Parking",
+            "total_estimate": 250.0,
+            "item_count": 2,
+        },
+    ]
+
+
+def test_build_summary_rows_formats_and_totals_in_one_pass(tmp_path: Path):
+    service = PDFService(exports_dir=tmp_path)
+    summaries = _summaries()
+    raw_headers = list(summaries[0].keys())
+
+    rows, totals_row = service._build_summary_rows(summaries, raw_headers, "GRAND TOTAL")
+
+    assert rows == [
+        ["S1", "Main building", "₪ 1,000.50", "3"],
+        ["S2", "Parking", "₪ 250.00", "2"],
+    ]
+    assert totals_row == ["GRAND TOTAL", "", "₪ 1,250.50", "5"]
+
+
+def test_export_structures_summary_writes_pdf(tmp_path: Path):
+    service = PDFService(exports_dir=tmp_path)
+
+    pdf_path = Path(service.export_structures_summary(_summaries(), None, "en"))
+
+    assert pdf_path.is_file()
+    assert pdf_path.read_bytes().startswith(b"%PDF")
+
+
+def test_boq_currency_columns_exclude_quantities():
+    from services.pdf_service import _is_boq_currency_key
+
+    assert _is_boq_currency_key("price")
+    assert _is_boq_currency_key("total_contract_sum")
+    assert _is_boq_currency_key("updated_contract_sum_3")
+    assert not _is_boq_currency_key("updated_contract_quantity_3")
+    assert not _is_boq_currency_key("original_contract_quantity")
+
+
+def test_row_values_getter_returns_tuple_in_key_order():
+    from services.pdf_service import _row_values_getter
+
+    row = {"b": 2, "a": 1, "c": 3}
+    assert _row_values_getter(["a", "c"])(row) == (1, 3)
+    assert _row_values_getter(["c"])(row) == (3,)
+
+
+def test_export_boq_items_below_canvas_threshold_builds_one_table(tmp_path: Path, monkeypatch):
+    service = PDFService(exports_dir=tmp_path)
+    created = []
+    original = service._create_boq_single_line_table
+
+    def record(data, *args, **kwargs):
+        created.append(len(data))
+        return original(data, *args, **kwargs)
+
+    monkeypatch.setattr(service, "_create_boq_single_line_table", record)
+    items = [
+        {"section_number": f"1.{i}", "description": f"Item {i}", "total_estimate": 10.0}
+        for i in range(3)
+    ]
+
+    pdf_path = Path(service.export_boq_items(items, None, "en"))
+
+    assert pdf_path.read_bytes().startswith(b"%PDF")
+    # header row + 3 items + totals row
+    assert created == [5]
+
+
+def test_build_summary_rows_passes_through_missing_values(tmp_path: Path):
+    service = PDFService(exports_dir=tmp_path)
+    summaries = _summaries()
+    summaries[1]["total_estimate"] = None
+
+    rows, totals_row = service._build_summary_rows(summaries, list(summaries[0].keys()), "GRAND TOTAL")
+
+    assert rows[1] == ["S2", "Parking", "None", "2"]
+    assert totals_row == ["GRAND TOTAL", "", "₪ 1,000.50", "5"]
+
+
+def test_export_boq_items_formats_numbers_after_text_in_a_column(tmp_path: Path):
+    from pypdf import PdfReader
+
+    service = PDFService(exports_dir=tmp_path)
+    items = [
+        {"section_number": "1.1", "original_contract_quantity": "n/a", "total_estimate": 10.0},
+        {"section_number": "1.2", "original_contract_quantity": 12.0, "total_estimate": 20.0},
+    ]
+
+    text = PdfReader(service.export_boq_items(items, None, "en")).pages[0].extract_text()
+
+    assert "12.0" not in text
+    assert "1.2\n12\n" in text
+
+
+def test_format_boq_quantity():
+    from services.pdf_service import _format_boq_quantity
+
+    assert _format_boq_quantity(12.0) == "12"
+    assert _format_boq_quantity(1234.5) == "1,234.50"
+    assert _format_boq_quantity(None) == "None"
+
+
+def test_export_systems_summary_falls_back_to_plain_table(tmp_path: Path, monkeypatch):
+    service = PDFService(exports_dir=tmp_path)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("paragraph rendering failed")
+
+    monkeypatch.setattr(service, "_create_robust_hebrew_table", fail)
+    summaries = [{"system": "HVAC", "total_estimate": 10.0, "item_count": 1}]
+
+    pdf_path = Path(service.export_systems_summary(summaries, None, "he"))
+
+    assert pdf_path.read_bytes().startswith(b"%PDF")
+
+
+def test_export_boq_items_canvas_path_matches_table_layout(tmp_path: Path, monkeypatch):
+    from pypdf import PdfReader
+    import services.pdf_service as pdf_service
+
+    def export(items, min_rows, subdir):
+        monkeypatch.setattr(pdf_service, "BOQ_PDF_CANVAS_MIN_ROWS", min_rows)
+        exports_dir = tmp_path / subdir
+        exports_dir.mkdir()
+        reader = PdfReader(PDFService(exports_dir=exports_dir).export_boq_items(items, None, "he"))
+        return [page.extract_text() for page in reader.pages]
+
+    for multiline in (False, True):
+        items = [
+            {
+                "section_number": f"1.{i}",
+                "description": "תיאור פריט" if i % 3 == 0 else f"Item {i}",
+                "notes": "Line one\nline two" if multiline and i % 4 == 0 else "",
+                "original_contract_quantity": 2.5,
+                "total_estimate": 100.0 * i,
+            }
+            for i in range(120)
+        ]
+
+        table_pages = export(items, 10**9, f"table_{multiline}")
+        canvas_pages = export(items, 0, f"canvas_{multiline}")
+
+        assert len(table_pages) > 1
+        assert canvas_pages == table_pages
+
+
+def test_write_pdf_file_replaces_target_without_leaving_temp_files(tmp_path: Path):
+    from io import BytesIO
+
+    from services.pdf_service import _write_pdf_file
+
+    target = tmp_path / "report.pdf"
+    target.write_bytes(b"old")
+
+    _write_pdf_file(target, BytesIO(b"%PDF-new"))
+
+    assert target.read_bytes() == b"%PDF-new"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+
+def test_write_pdf_file_handles_concurrent_writes_to_one_target(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+    from io import BytesIO
+
+    from services.pdf_service import _write_pdf_file
+
+    target = tmp_path / "sheet.pdf"
+    payloads = [b"%PDF-" + bytes([i]) * 200_000 for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda payload: _write_pdf_file(target, BytesIO(payload)), payloads))
+
+    assert target.read_bytes() in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["sheet.pdf"]
+
+
+def test_format_currency_value():
+    from services.pdf_service import _format_currency_value
+
+    assert _format_currency_value(1234.5) == "₪ 1,234.50"
+    assert _format_currency_value(0) == "₪ 0.00"
+    assert _format_currency_value("N/A") == "N/A"
+    assert _format_currency_value(None) == "None"
+
+
+def test_format_currency_cached_keeps_sign_of_zero():
+    from services.pdf_service import _format_currency_cached
+
+    assert _format_currency_cached(-0.0) == "₪ -0.00"
+    assert _format_currency_cached(0.0) == "₪ 0.00"
+    assert _format_currency_cached(0) == "₪ 0.00"
+    assert _format_currency_cached(-0.0) == "₪ -0.00"
+
+
+def test_detect_rtl(tmp_path: Path):
+    service = PDFService(exports_dir=tmp_path)
+
+    assert not service._detect_rtl("")
+    assert not service._detect_rtl("1,234.50 m3")
+    assert not service._detect_rtl("Café")
+    assert service._detect_rtl("קורות")
+    assert service._detect_rtl("₪ 12.00")
+
+
+def test_cached_string_width_matches_reportlab():
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    from services.pdf_service import _cached_string_width
+
+    for text in ("", "GRAND TOTAL", "1,234.50", "Café – €5", "קורות ₪"):
+        for font_name in ("Helvetica", "Helvetica-Bold"):
+            assert _cached_string_width(text, font_name, 7) == stringWidth(text, font_name, 7)
+
+
+def test_cached_string_width_matches_reportlab_for_truetype(tmp_path: Path):
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    from services.pdf_service import _cached_string_width
+
+    hebrew_font = PDFService(exports_dir=tmp_path).hebrew_font
+    for text in ("", "סה\"כ מחושב", "₪ 1,234.50", "Mixed טקסט 42", "\U0001F600"):
+        assert _cached_string_width(text, hebrew_font, 8) == stringWidth(text, hebrew_font, 8)
+
+
+def test_select_landscape_page_size():
+    from services.pdf_service import _select_landscape_page_size
+
+    assert _select_landscape_page_size(500) == ((842, 595), "A4")
+    assert _select_landscape_page_size(842) == ((842, 595), "A4")
+    assert _select_landscape_page_size(843) == ((1191, 842), "A3")
+    assert _select_landscape_page_size(3371) == ((3400, 842), "Custom_3400x842")
+
+
+def test_summary_project_name_prefers_language_specific_name(tmp_path: Path):
+    from types import SimpleNamespace
+
+    service = PDFService(exports_dir=tmp_path)
+    project_info = SimpleNamespace(project_name="Tower A", project_name_hebrew="מגדל א")
+
+    class Session:
+        def query(self, model):
+            return SimpleNamespace(first=lambda: project_info)
+
+    assert service._get_summary_project_name(Session(), "he", "Title") == "מגדל א"
+    assert service._get_summary_project_name(Session(), "en", "Title") == "Tower A"
+    assert service._get_summary_project_name(None, "en", "Title") == "Title"
+
+
+def test_empty_summary_export_writes_title_page(tmp_path: Path):
+    from pypdf import PdfReader
+
+    service = PDFService(exports_dir=tmp_path)
+
+    reader = PdfReader(service.export_systems_summary([], None, "en"))
+
+    assert len(reader.pages) == 1
+    assert "Systems Summary" in reader.pages[0].extract_text()
+
+
+def test_project_info_is_queried_once_per_session(tmp_path: Path):
+    from types import SimpleNamespace
+
+    service = PDFService(exports_dir=tmp_path)
+    project_info = SimpleNamespace(project_name="Tower A", project_name_hebrew="מגדל א")
+    queries = []
+
+    class Session:
+        def query(self, model):
+            queries.append(model)
+            return SimpleNamespace(first=lambda: project_info)
+
+    session = Session()
+    assert service._get_project_names(session) == ("Tower A", "מגדל א")
+    assert service._get_summary_project_name(session, "he", "Title") == "מגדל א"
+    assert len(queries) == 1
+
+    service._get_project_names(Session())
+    assert len(queries) == 2
+
+
+def test_robust_table_keeps_fitting_body_text_as_plain_strings(tmp_path: Path):
+    from reportlab.platypus import Paragraph
+
+    service = PDFService(exports_dir=tmp_path)
+    data = [
+        ["Name", "Count"],
+        ["S-1", 3],
+        ["two  spaces", "x" * 80],
+        ["מבנה", "4"],
+        ["GRAND TOTAL", "7"],
+    ]
+
+    table = service._create_robust_hebrew_table(data, data[0], [100, 100], repeat_rows=1, plain_text_cells=True)
+    cells = table._cellvalues
+
+    assert cells[1] == ["S-1", "3"]
+    assert cells[3][1] == "4"
+    assert all(isinstance(cell, Paragraph) for cell in cells[0] + cells[2] + cells[3][:1] + cells[4])
+
+
+def test_export_timestamp_is_unique_within_a_second(monkeypatch):
+    import services.pdf_service as pdf_service
+
+    stamps = iter(["20240101_000000"] * 3 + ["20240101_000001"])
+    monkeypatch.setattr(pdf_service.time, "strftime", lambda fmt: next(stamps))
+    monkeypatch.setattr(pdf_service, "_last_export_timestamp", {"stamp": "", "count": 0})
+
+    assert [pdf_service._export_timestamp() for _ in range(4)] == [
+        "20240101_000000",
+        "20240101_000000_2",
+        "20240101_000000_3",
+        "20240101_000001",
+    ]